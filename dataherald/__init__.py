@@ -1,12 +1,19 @@
-from dataherald.api import API
+from typing import TYPE_CHECKING
+
 from dataherald.config import Settings, System
 
+if TYPE_CHECKING:
+    from dataherald.api import API
+
 __settings = Settings()
 __version__ = "0.0.1"
 
 
-def client(settings: Settings = __settings) -> API:
+def client(settings: Settings = __settings) -> "API":
     """Return a running dataherald.API instance"""
+    # Imported here so modules that only need a submodule, such as the SQL
+    # parse pool workers, do not load the whole API.
+    from dataherald.api import API  # noqa: PLC0415
 
     system = System(settings)
     api = system.instance(API)
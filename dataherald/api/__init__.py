@@ -1,6 +1,5 @@
 import io
 from abc import ABC, abstractmethod
-from typing import List
 
 from fastapi import BackgroundTasks
 
@@ -113,13 +112,13 @@ class API(Component, ABC):
         pass
 
     @abstractmethod
-    def get_prompts(self, db_connection_id: str | None = None) -> List[PromptResponse]:
+    def get_prompts(self, db_connection_id: str | None = None) -> list[PromptResponse]:
         pass
 
     @abstractmethod
     def add_golden_sqls(
-        self, golden_sqls: List[GoldenSQLRequest]
-    ) -> List[GoldenSQLResponse]:
+        self, golden_sqls: list[GoldenSQLRequest]
+    ) -> list[GoldenSQLResponse]:
         pass
 
     @abstractmethod
@@ -141,7 +140,7 @@ class API(Component, ABC):
     @abstractmethod
     def get_golden_sqls(
         self, db_connection_id: str = None, page: int = 1, limit: int = 10
-    ) -> List[GoldenSQL]:
+    ) -> list[GoldenSQL]:
         pass
 
     @abstractmethod
@@ -159,7 +158,7 @@ class API(Component, ABC):
     @abstractmethod
     def get_instructions(
         self, db_connection_id: str = None, page: int = 1, limit: int = 10
-    ) -> List[InstructionResponse]:
+    ) -> list[InstructionResponse]:
         pass
 
     @abstractmethod
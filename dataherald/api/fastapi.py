@@ -6,7 +6,6 @@ import logging
 import os
 import time
 from queue import Queue
-from typing import List
 
 from bson.objectid import InvalidId, ObjectId
 from fastapi import BackgroundTasks, HTTPException
@@ -394,7 +393,7 @@ class FastAPI(API):
         return PromptResponse(**prompt.dict())
 
     @override
-    def get_prompts(self, db_connection_id: str | None = None) -> List[PromptResponse]:
+    def get_prompts(self, db_connection_id: str | None = None) -> list[PromptResponse]:
         prompt_service = PromptService(self.storage)
         query = {}
         if db_connection_id:
@@ -414,8 +413,8 @@ class FastAPI(API):
 
     @override
     def add_golden_sqls(
-        self, golden_sqls: List[GoldenSQLRequest]
-    ) -> List[GoldenSQLResponse]:
+        self, golden_sqls: list[GoldenSQLRequest]
+    ) -> list[GoldenSQLResponse]:
         """Takes in a list of NL <> SQL pairs and stores them to be used in prompts to the LLM"""
         context_store = self.system.instance(ContextStore)
         try:
@@ -471,7 +470,7 @@ class FastAPI(API):
     @override
     def get_golden_sqls(
         self, db_connection_id: str = None, page: int = 1, limit: int = 10
-    ) -> List[GoldenSQL]:
+    ) -> list[GoldenSQL]:
         golden_sqls_repository = GoldenSQLRepository(self.storage)
         if db_connection_id:
             return golden_sqls_repository.find_by(
@@ -513,6 +512,7 @@ class FastAPI(API):
                 metadata=instruction_request.metadata,
             )
             instruction = instruction_repository.insert(instruction)
+            self.system.instance(ContextStore).invalidate_context_cache()
         except Exception as e:
             return error_response(
                 e, instruction_request.dict(), "instruction_not_created"
@@ -523,7 +523,7 @@ class FastAPI(API):
     @override
     def get_instructions(
         self, db_connection_id: str = None, page: int = 1, limit: int = 10
-    ) -> List[InstructionResponse]:
+    ) -> list[InstructionResponse]:
         instruction_repository = InstructionRepository(self.storage)
         if db_connection_id:
             instructions = instruction_repository.find_by(
@@ -544,6 +544,7 @@ class FastAPI(API):
         deleted = instruction_repository.delete_by_id(instruction_id)
         if deleted == 0:
             raise HTTPException(status_code=404, detail="Instruction not found")
+        self.system.instance(ContextStore).invalidate_context_cache()
         return {"status": "success"}
 
     @override
@@ -563,6 +564,7 @@ class FastAPI(API):
             metadata=instruction_request.metadata,
         )
         instruction_repository.update(updated_instruction)
+        self.system.instance(ContextStore).invalidate_context_cache()
         return InstructionResponse(**updated_instruction.dict())
 
     @override
@@ -1,6 +1,5 @@
 import os
 from abc import ABC, abstractmethod
-from typing import List, Tuple
 
 from dataherald.config import Component, System
 from dataherald.db import DB
@@ -24,14 +23,17 @@ class ContextStore(Component, ABC):
 
     @abstractmethod
     def retrieve_context_for_question(
-        self, prompt: Prompt, number_of_samples: int = 3
-    ) -> Tuple[List[dict] | None, List[dict] | None]:
+        self, prompt: Prompt, number_of_samples: int = 3, hybrid: bool = True
+    ) -> tuple[list[dict] | None, list[dict] | None]:
         pass
 
+    def invalidate_context_cache(self) -> None:  # noqa: B027
+        """Drops cached context after golden SQLs or instructions change."""
+
     @abstractmethod
-    def add_golden_sqls(self, golden_sqls: List[GoldenSQLRequest]) -> List[GoldenSQL]:
+    def add_golden_sqls(self, golden_sqls: list[GoldenSQLRequest]) -> list[GoldenSQL]:
         pass
 
     @abstractmethod
-    def remove_golden_sqls(self, ids: List) -> bool:
+    def remove_golden_sqls(self, ids: list) -> bool:
         pass
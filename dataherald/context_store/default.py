@@ -1,8 +1,13 @@
 import logging
-from typing import List, Tuple
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 
+from cachetools import TTLCache
 from overrides import override
-from sql_metadata import Parser
+from sqlparse.lexer import Lexer
 
 from dataherald.config import System
 from dataherald.context_store import ContextStore
@@ -13,9 +18,22 @@ from dataherald.repositories.database_connections import (
 from dataherald.repositories.golden_sqls import GoldenSQLRepository
 from dataherald.repositories.instructions import InstructionRepository
 from dataherald.types import GoldenSQL, GoldenSQLRequest, Prompt
+from dataherald.utils.sql_parsing import parse_sql
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_CACHE_MAXSIZE = 4096
+CONTEXT_CACHE_TTL = 300
+GOLDEN_SQLS_EXISTENCE_CACHE_MAXSIZE = 1024
+GOLDEN_SQLS_EXISTENCE_CACHE_TTL = 60
+SQL_PARSER_MIN_POOL_BATCH = 64
+SQL_PARSER_CHUNK_SIZE = 32
+SQL_PARSER_DEFAULT_MAX_WORKERS = 4
+
+# sqlparse publishes its shared lexer before loading the token rules, so
+# build it here rather than racing on it from concurrent request threads.
+Lexer.get_default_instance()
+
 
 class MalformedGoldenSQLError(Exception):
     pass
@@ -24,88 +42,195 @@ class MalformedGoldenSQLError(Exception):
 class DefaultContextStore(ContextStore):
     def __init__(self, system: System):
         super().__init__(system)
+        InstructionRepository(self.db).create_indexes()
+        GoldenSQLRepository(self.db).create_indexes()
+        self._context_cache = TTLCache(
+            maxsize=CONTEXT_CACHE_MAXSIZE, ttl=CONTEXT_CACHE_TTL
+        )
+        self._context_cache_lock = threading.Lock()
+        self._context_cache_generation = 0
+        self._has_golden_sqls_cache = TTLCache(
+            maxsize=GOLDEN_SQLS_EXISTENCE_CACHE_MAXSIZE,
+            ttl=GOLDEN_SQLS_EXISTENCE_CACHE_TTL,
+        )
+        self._parse_pool = None
+        self._parse_pool_lock = threading.Lock()
+        # One fetch per in-flight request, so match the request thread pool;
+        # threads are only started when needed.
+        self._instructions_executor = ThreadPoolExecutor(
+            max_workers=int(os.environ.get("THREAD_POOL_SIZE") or "100"),
+            thread_name_prefix="context-instructions",
+        )
 
     @override
     def retrieve_context_for_question(
-        self, prompt: Prompt, number_of_samples: int = 3
-    ) -> Tuple[List[dict] | None, List[dict] | None]:
+        self, prompt: Prompt, number_of_samples: int = 3, hybrid: bool = True
+    ) -> tuple[list[dict] | None, list[dict] | None]:
+        # The generation is part of the key so invalidating the cache does not
+        # need to scan it; stale entries age out through the TTL and LRU.
+        cache_key = (
+            prompt.text.strip().lower(),
+            prompt.db_connection_id,
+            number_of_samples,
+            hybrid,
+            self._context_cache_generation,
+        )
+        with self._context_cache_lock:
+            context = self._context_cache.get(cache_key)
+        if context is not None:
+            return context
+
         logger.info(f"Getting context for {prompt.text}")
+        # The instructions live in Mongo only, so fetch them while the vector
+        # store query and the golden SQL lookup run on this thread.
+        instructions_future = self._instructions_executor.submit(
+            self._retrieve_instructions, prompt.db_connection_id
+        )
+        samples = self._retrieve_samples(prompt, number_of_samples, hybrid)
+        instructions = instructions_future.result()
+
+        with self._context_cache_lock:
+            self._context_cache[cache_key] = (samples, instructions)
+        return samples, instructions
+
+    @override
+    def invalidate_context_cache(self) -> None:
+        with self._context_cache_lock:
+            self._context_cache_generation += 1
+            self._has_golden_sqls_cache.clear()
+
+    def _retrieve_samples(
+        self, prompt: Prompt, number_of_samples: int, hybrid: bool
+    ) -> list[dict] | None:
+        if number_of_samples <= 0 or not self._has_golden_sqls(prompt.db_connection_id):
+            return None
         closest_questions = self.vector_store.query(
             query_texts=[prompt.text],
             db_connection_id=prompt.db_connection_id,
             collection=self.golden_sql_collection,
             num_results=number_of_samples,
+            hybrid=hybrid,
         )
 
         samples = []
         golden_sqls_repository = GoldenSQLRepository(self.db)
+        golden_sqls = {
+            golden_sql["id"]: golden_sql
+            for golden_sql in golden_sqls_repository.find_projected_by_ids(
+                [question["id"] for question in closest_questions]
+            )
+        }
         for question in closest_questions:
-            golden_sql = golden_sqls_repository.find_by_id(question["id"])
+            golden_sql = golden_sqls.get(question["id"])
             if golden_sql is not None:
                 samples.append(
                     {
-                        "prompt_text": golden_sql.prompt_text,
-                        "sql": golden_sql.sql,
+                        "prompt_text": golden_sql["prompt_text"],
+                        "sql": golden_sql["sql"],
                         "score": question["score"],
                     }
                 )
         if len(samples) == 0:
-            samples = None
-        instructions = []
+            return None
+        return samples
+
+    def _has_golden_sqls(self, db_connection_id: str) -> bool:
+        with self._context_cache_lock:
+            has_golden_sqls = self._has_golden_sqls_cache.get(db_connection_id)
+            generation = self._context_cache_generation
+        if has_golden_sqls is None:
+            has_golden_sqls = GoldenSQLRepository(self.db).exists_for_db_connection(
+                db_connection_id
+            )
+            # Golden SQLs added or removed during the lookup make the result stale
+            with self._context_cache_lock:
+                if generation == self._context_cache_generation:
+                    self._has_golden_sqls_cache[db_connection_id] = has_golden_sqls
+        return has_golden_sqls
+
+    def _retrieve_instructions(self, db_connection_id: str) -> list[dict] | None:
         instruction_repository = InstructionRepository(self.db)
-        all_instructions = instruction_repository.find_all()
-        for instruction in all_instructions:
-            if instruction.db_connection_id == prompt.db_connection_id:
-                instructions.append(
-                    {
-                        "instruction": instruction.instruction,
-                    }
-                )
+        instructions = [
+            {"instruction": instruction}
+            for instruction in instruction_repository.find_instruction_texts(
+                db_connection_id
+            )
+        ]
         if len(instructions) == 0:
-            instructions = None
+            return None
+        return instructions
 
-        return samples, instructions
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        # Parsing is pure-Python and GIL-bound, so large imports are validated in
+        # worker processes. Spawn avoids forking the server's Mongo/HTTP threads.
+        # The pool is only started by the first large import.
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                max_workers = int(
+                    os.environ.get("SQL_PARSER_MAX_WORKERS")
+                    or min(os.cpu_count() or 1, SQL_PARSER_DEFAULT_MAX_WORKERS)
+                )
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._parse_pool
 
     @override
-    def add_golden_sqls(self, golden_sqls: List[GoldenSQLRequest]) -> List[GoldenSQL]:
+    def add_golden_sqls(self, golden_sqls: list[GoldenSQLRequest]) -> list[GoldenSQL]:
         """Creates embeddings of the questions and adds them to the VectorDB. Also adds the golden sqls to the DB"""
         golden_sqls_repository = GoldenSQLRepository(self.db)
         db_connection_repository = DatabaseConnectionRepository(self.db)
-        stored_golden_sqls = []
-        for record in golden_sqls:
-            try:
-                Parser(record.sql).tables  # noqa: B018
-            except Exception as e:
+        sqls = [record.sql for record in golden_sqls]
+        if len(sqls) >= SQL_PARSER_MIN_POOL_BATCH:
+            parse_errors = list(
+                self._get_parse_pool().map(
+                    parse_sql, sqls, chunksize=SQL_PARSER_CHUNK_SIZE
+                )
+            )
+        else:
+            parse_errors = [parse_sql(sql) for sql in sqls]
+        for record, error in zip(golden_sqls, parse_errors, strict=True):
+            if error is not None:
                 raise MalformedGoldenSQLError(
                     f"SQL {record.sql} is malformed. Please check the syntax."
-                ) from e
+                ) from error
 
-            db_connection = db_connection_repository.find_by_id(record.db_connection_id)
+        for db_connection_id in dict.fromkeys(
+            record.db_connection_id for record in golden_sqls
+        ):
+            db_connection = db_connection_repository.find_by_id(db_connection_id)
             if not db_connection:
                 raise DatabaseConnectionNotFoundError(
-                    f"Database connection not found, {record.db_connection_id}"
+                    f"Database connection not found, {db_connection_id}"
                 )
 
-            prompt_text = record.prompt_text
-            golden_sql = GoldenSQL(
-                prompt_text=prompt_text,
-                sql=record.sql,
-                db_connection_id=record.db_connection_id,
-                metadata=record.metadata,
-            )
-            stored_golden_sqls.append(golden_sqls_repository.insert(golden_sql))
+        created_at = datetime.now()
+        stored_golden_sqls = golden_sqls_repository.insert_many(
+            [
+                GoldenSQL(
+                    prompt_text=record.prompt_text,
+                    sql=record.sql,
+                    db_connection_id=record.db_connection_id,
+                    created_at=created_at,
+                    metadata=record.metadata,
+                )
+                for record in golden_sqls
+            ]
+        )
         self.vector_store.add_records(stored_golden_sqls, self.golden_sql_collection)
+        self.invalidate_context_cache()
         return stored_golden_sqls
 
     @override
-    def remove_golden_sqls(self, ids: List) -> bool:
+    def remove_golden_sqls(self, ids: list) -> bool:
         """Removes the golden sqls from the DB and the VectorDB"""
         golden_sqls_repository = GoldenSQLRepository(self.db)
-        for id in ids:
-            self.vector_store.delete_record(
-                collection=self.golden_sql_collection, id=id
+        self.vector_store.delete_records(collection=self.golden_sql_collection, ids=ids)
+        deleted = golden_sqls_repository.delete_by_ids(ids)
+        self.invalidate_context_cache()
+        if deleted != len(ids):
+            logger.warning(
+                f"{len(ids) - deleted} of {len(ids)} golden records not found: {ids}"
             )
-            deleted = golden_sqls_repository.delete_by_id(id)
-            if deleted == 0:
-                logger.warning(f"Golden record with id {id} not found")
         return True
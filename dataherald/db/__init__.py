@@ -12,6 +12,12 @@ class DB(Component, ABC):
     def insert_one(self, collection: str, obj: dict) -> int:
         pass
 
+    @abstractmethod
+    def insert_many(
+        self, collection: str, objs: list[dict], ordered: bool = True
+    ) -> list:
+        pass
+
     @abstractmethod
     def rename(self, old_collection_name: str, new_collection_name) -> None:
         pass
@@ -22,6 +28,10 @@ class DB(Component, ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def create_index(self, collection: str, field: str) -> None:
+        pass
+
     @abstractmethod
     def update_or_create(self, collection: str, query: dict, obj: dict) -> int:
         pass
@@ -42,6 +52,8 @@ class DB(Component, ABC):
         sort: list = None,
         page: int = 0,
         limit: int = 0,
+        *,
+        projection: dict | None = None,
     ) -> list:
         pass
 
@@ -52,3 +64,7 @@ class DB(Component, ABC):
     @abstractmethod
     def delete_by_id(self, collection: str, id: str) -> int:
         pass
+
+    @abstractmethod
+    def delete_many(self, collection: str, query: dict) -> int:
+        pass
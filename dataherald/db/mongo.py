@@ -23,6 +23,14 @@ class MongoDB(DB):
     def insert_one(self, collection: str, obj: dict) -> int:
         return self._data_store[collection].insert_one(obj).inserted_id
 
+    @override
+    def insert_many(
+        self, collection: str, objs: list[dict], ordered: bool = True
+    ) -> list:
+        return (
+            self._data_store[collection].insert_many(objs, ordered=ordered).inserted_ids
+        )
+
     @override
     def rename(self, old_collection_name: str, new_collection_name) -> None:
         self._data_store[old_collection_name].rename(new_collection_name)
@@ -35,6 +43,10 @@ class MongoDB(DB):
             {}, {"$rename": {old_field_name: new_field_name}}
         )
 
+    @override
+    def create_index(self, collection: str, field: str) -> None:
+        self._data_store[collection].create_index(field)
+
     @override
     def update_or_create(self, collection: str, query: dict, obj: dict) -> int:
         row = self.find_one(collection, query)
@@ -57,9 +69,11 @@ class MongoDB(DB):
         sort: list = None,
         page: int = 0,
         limit: int = 0,
+        *,
+        projection: dict | None = None,
     ) -> list:
         skip_count = (page - 1) * limit
-        cursor = self._data_store[collection].find(query)
+        cursor = self._data_store[collection].find(query, projection)
         if sort:
             cursor = cursor.sort(sort)
         if page > 0 and limit > 0:
@@ -79,3 +93,7 @@ class MongoDB(DB):
     def delete_by_id(self, collection: str, id: str) -> int:
         result = self._data_store[collection].delete_one({"_id": ObjectId(id)})
         return result.deleted_count
+
+    @override
+    def delete_many(self, collection: str, query: dict) -> int:
+        return self._data_store[collection].delete_many(query).deleted_count
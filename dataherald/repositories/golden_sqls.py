@@ -19,6 +19,23 @@ class GoldenSQLRepository:
         golden_sql.id = str(self.storage.insert_one(DB_COLLECTION, golden_sql_dict))
         return golden_sql
 
+    def insert_many(self, golden_sqls: list[GoldenSQL]) -> list[GoldenSQL]:
+        if not golden_sqls:
+            return []
+        golden_sql_dicts = []
+        for golden_sql in golden_sqls:
+            golden_sql_dict = golden_sql.dict(exclude={"id"})
+            golden_sql_dict["db_connection_id"] = str(golden_sql.db_connection_id)
+            golden_sql_dicts.append(golden_sql_dict)
+        # The documents are independent, so an unordered write lets the server
+        # apply the batch without stopping at the first failed document.
+        inserted_ids = self.storage.insert_many(
+            DB_COLLECTION, golden_sql_dicts, ordered=False
+        )
+        for golden_sql, inserted_id in zip(golden_sqls, inserted_ids, strict=True):
+            golden_sql.id = str(inserted_id)
+        return golden_sqls
+
     def find_one(self, query: dict) -> GoldenSQL | None:
         row = self.storage.find_one(DB_COLLECTION, query)
         if not row:
@@ -46,6 +63,31 @@ class GoldenSQLRepository:
         row["db_connection_id"] = str(row["db_connection_id"])
         return GoldenSQL(**row)
 
+    def find_projected_by_ids(
+        self, ids: list[str], fields: tuple[str, ...] = ("prompt_text", "sql")
+    ) -> list[dict]:
+        """Returns plain dicts with only the id and the requested fields, skipping GoldenSQL validation."""
+        if not ids:
+            return []
+        rows = self.storage.find(
+            DB_COLLECTION,
+            {"_id": {"$in": [ObjectId(id) for id in ids]}},
+            projection=dict.fromkeys(fields, 1),
+        )
+        for row in rows:
+            row["id"] = str(row.pop("_id"))
+        return rows
+
+    def exists_for_db_connection(self, db_connection_id: str) -> bool:
+        rows = self.storage.find(
+            DB_COLLECTION,
+            {"db_connection_id": str(db_connection_id)},
+            page=1,
+            limit=1,
+            projection={"_id": 1},
+        )
+        return len(rows) > 0
+
     def find_by(self, query: dict, page: int = 1, limit: int = 10) -> list[GoldenSQL]:
         rows = self.storage.find(DB_COLLECTION, query, page=page, limit=limit)
         golden_sqls = []
@@ -66,3 +108,11 @@ class GoldenSQLRepository:
 
     def delete_by_id(self, id: str) -> int:
         return self.storage.delete_by_id(DB_COLLECTION, id)
+
+    def create_indexes(self) -> None:
+        self.storage.create_index(DB_COLLECTION, "db_connection_id")
+
+    def delete_by_ids(self, ids: list[str]) -> int:
+        return self.storage.delete_many(
+            DB_COLLECTION, {"_id": {"$in": [ObjectId(id) for id in ids]}}
+        )
@@ -52,6 +52,17 @@ class InstructionRepository:
             result.append(Instruction(**row))
         return result
 
+    def find_instruction_texts(self, db_connection_id: str) -> list[str]:
+        rows = self.storage.find(
+            DB_COLLECTION,
+            {"db_connection_id": str(db_connection_id)},
+            projection={"instruction": 1},
+        )
+        return [row["instruction"] for row in rows]
+
+    def create_indexes(self) -> None:
+        self.storage.create_index(DB_COLLECTION, "db_connection_id")
+
     def find_all(self, page: int = 0, limit: int = 0) -> list[Instruction]:
         rows = self.storage.find_all(DB_COLLECTION, page=page, limit=limit)
         result = []
@@ -2,6 +2,7 @@ import os
 from typing import List
 
 import fastapi
+from anyio import to_thread
 from fastapi import BackgroundTasks, status
 from fastapi import FastAPI as _FastAPI
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -57,10 +58,22 @@ def use_route_names_as_operation_ids(app: _FastAPI) -> None:
             route.operation_id = route.name
 
 
+def set_thread_pool_size() -> None:
+    """
+    Sync endpoints run on AnyIO's worker threads and block them for the whole
+    Mongo, vector store and LLM round-trip, so the pool size caps how many
+    requests are served concurrently.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = int(
+        os.environ.get("THREAD_POOL_SIZE") or "100"
+    )
+
+
 class FastAPI(dataherald.server.Server):
     def __init__(self, settings: Settings):
         super().__init__(settings)
         self._app = fastapi.FastAPI(debug=True)
+        self._app.add_event_handler("startup", set_thread_pool_size)
         self._api: dataherald.api.API = dataherald.client(settings)
 
         self.router = fastapi.APIRouter()
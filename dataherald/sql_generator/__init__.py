@@ -25,6 +25,9 @@ from dataherald.sql_generator.create_sql_query_status import create_sql_query_st
 from dataherald.types import LLMConfig, Prompt, SQLGeneration
 from dataherald.utils.strings import contains_line_breaks
 
+MARKDOWN_SQL_PATTERN = re.compile(r"```sql(.*?)```", re.DOTALL)
+SQL_COMMENT_PATTERN = re.compile(r"--.*$", re.MULTILINE)
+
 
 class EngineTimeOutORItemLimitError(Exception):
     pass
@@ -56,8 +59,7 @@ class SQLGenerator(Component, ABC):
         return response
 
     def remove_markdown(self, query: str) -> str:
-        pattern = r"```sql(.*?)```"
-        matches = re.findall(pattern, query, re.DOTALL)
+        matches = MARKDOWN_SQL_PATTERN.findall(query)
         if matches:
             return matches[0].strip()
         return ""
@@ -89,10 +91,8 @@ class SQLGenerator(Component, ABC):
         return formatted_intermediate_representation
 
     def format_sql_query(self, sql_query: str) -> str:
-        comments = [
-            match.group() for match in re.finditer(r"--.*$", sql_query, re.MULTILINE)
-        ]
-        sql_query_without_comments = re.sub(r"--.*$", "", sql_query, flags=re.MULTILINE)
+        comments = SQL_COMMENT_PATTERN.findall(sql_query)
+        sql_query_without_comments = SQL_COMMENT_PATTERN.sub("", sql_query)
 
         if contains_line_breaks(sql_query_without_comments.strip()):
             return sql_query
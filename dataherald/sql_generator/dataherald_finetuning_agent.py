@@ -454,8 +454,10 @@ class DataheraldFinetuningAgent(SQLGenerator):
         tools = toolkit.get_tools()
         admin_instructions = ""
         if toolkit.instructions:
-            for index, instruction in enumerate(toolkit.instructions):
-                admin_instructions += f"{index+1}) {instruction['instruction']}\n"
+            admin_instructions = "".join(
+                f"{index+1}) {instruction['instruction']}\n"
+                for index, instruction in enumerate(toolkit.instructions)
+            )
         if self.use_fintuned_model_only:
             prefix = FINETUNING_AGENT_PREFIX_FINETUNING_ONLY
         prefix = prefix.format(
@@ -201,9 +201,9 @@ class GetUserInstructions(BaseSQLDatabaseTool, BaseTool):
         run_manager: CallbackManagerForToolRun | None = None,  # noqa: ARG002
     ) -> str:
         response = "Admin: All of the generated SQL queries must follow the below instructions:\n"
-        for instruction in self.instructions:
-            response += f"{instruction['instruction']}\n"
-        return response
+        return response + "".join(
+            f"{instruction['instruction']}\n" for instruction in self.instructions
+        )
 
     async def _arun(
         self,
@@ -492,11 +492,10 @@ class GetFewShotExamples(BaseSQLDatabaseTool, BaseTool):
             number_of_samples = int(number_of_samples.strip())
         else:
             return "Action input for the fewshot_examples_retriever tool should be an integer"
-        returned_output = ""
-        for example in self.few_shot_examples[:number_of_samples]:
-            returned_output += (
-                f"Question: {example['prompt_text']} -> SQL: {example['sql']}\n"
-            )
+        returned_output = "".join(
+            f"Question: {example['prompt_text']} -> SQL: {example['sql']}\n"
+            for example in self.few_shot_examples[:number_of_samples]
+        )
         if returned_output == "":
             returned_output = "No previously asked Question/SQL pairs are available"
         return returned_output
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dataherald.app import app, server
+from dataherald.context_store import ContextStore
+from dataherald.repositories.golden_sqls import GoldenSQLRepository
+from dataherald.types import GoldenSQLRequest, Prompt
+
+client = TestClient(app)
+
+HTTP_200_CODE = 200
+HTTP_201_CODE = 201
+DB_CONNECTION_ID = "64dfa0e103f5134086f7090c"
+INSTRUCTION_ID = "64dfa0e103f5134086f7090c"
+PROMPT = Prompt(text="How many users signed up?", db_connection_id=DB_CONNECTION_ID)
+
+
+@pytest.fixture
+def context_store(monkeypatch) -> ContextStore:
+    context_store = server._api.system.instance(ContextStore)
+    context_store.invalidate_context_cache()
+    monkeypatch.setattr(
+        GoldenSQLRepository, "exists_for_db_connection", lambda *_: True
+    )
+    monkeypatch.setattr(context_store.vector_store, "query", MagicMock(return_value=[]))
+    return context_store
+
+
+def assert_next_retrieval_misses_cache(context_store: ContextStore):
+    context_store.vector_store.query.reset_mock()
+    context_store.retrieve_context_for_question(PROMPT)
+    context_store.vector_store.query.assert_called_once()
+
+
+def test_repeated_prompt_is_a_cache_hit(context_store):
+    context_store.retrieve_context_for_question(PROMPT)
+    context_store.retrieve_context_for_question(
+        Prompt(text="  how many users signed up?", db_connection_id=DB_CONNECTION_ID)
+    )
+    context_store.vector_store.query.assert_called_once()
+
+
+def test_add_golden_sqls_invalidates_cache(context_store):
+    context_store.retrieve_context_for_question(PROMPT)
+    context_store.add_golden_sqls(
+        [
+            GoldenSQLRequest(
+                db_connection_id=DB_CONNECTION_ID,
+                prompt_text="How many users are there?",
+                sql="SELECT COUNT(*) FROM users",
+            )
+        ]
+    )
+    assert_next_retrieval_misses_cache(context_store)
+
+
+def test_remove_golden_sqls_invalidates_cache(context_store):
+    context_store.retrieve_context_for_question(PROMPT)
+    context_store.remove_golden_sqls(["651f2d76275132d5b65175eb"])
+    assert_next_retrieval_misses_cache(context_store)
+
+
+def test_add_instruction_invalidates_cache(context_store):
+    context_store.retrieve_context_for_question(PROMPT)
+    response = client.post(
+        "/api/v1/instructions",
+        json={"db_connection_id": DB_CONNECTION_ID, "instruction": "Use UTC dates"},
+    )
+    assert response.status_code == HTTP_201_CODE
+    assert_next_retrieval_misses_cache(context_store)
+
+
+def test_update_instruction_invalidates_cache(context_store):
+    context_store.retrieve_context_for_question(PROMPT)
+    response = client.put(
+        f"/api/v1/instructions/{INSTRUCTION_ID}",
+        json={"instruction": "Use UTC dates"},
+    )
+    assert response.status_code == HTTP_200_CODE
+    assert_next_retrieval_misses_cache(context_store)
+
+
+def test_delete_instruction_invalidates_cache(context_store):
+    server._api.storage.memory["instructions"].append(
+        {
+            "_id": INSTRUCTION_ID,
+            "instruction": "foo",
+            "db_connection_id": DB_CONNECTION_ID,
+        }
+    )
+    context_store.retrieve_context_for_question(PROMPT)
+    response = client.delete(f"/api/v1/instructions/{INSTRUCTION_ID}")
+    assert response.status_code == HTTP_200_CODE
+    assert_next_retrieval_misses_cache(context_store)
@@ -38,6 +38,12 @@ class TestDB(DB):
 
         return ObjectId("651f2d76275132d5b65175eb")
 
+    @override
+    def insert_many(
+        self, collection: str, objs: list[dict], ordered: bool = True  # noqa: ARG002
+    ) -> list:
+        return [self.insert_one(collection, obj) for obj in objs]
+
     @override
     def find_one(self, collection: str, query: dict) -> dict:  # noqa: ARG002
         if collection in self.memory:
@@ -64,6 +70,8 @@ class TestDB(DB):
         sort: list = None,
         page: int = 0,
         limit: int = 0,
+        *,
+        projection: dict | None = None,
     ) -> list:
         return []
 
@@ -88,6 +96,14 @@ class TestDB(DB):
                 return 1
         return 0
 
+    @override
+    def create_index(self, collection: str, field: str) -> None:
+        pass
+
+    @override
+    def delete_many(self, collection: str, query: dict) -> int:
+        return 0
+
     @override
     def rename(self, old_collection_name: str, new_collection_name) -> None:
         pass
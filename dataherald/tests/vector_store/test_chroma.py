@@ -0,0 +1,57 @@
+import pytest
+
+from dataherald.config import Settings, System
+from dataherald.vector_store.chroma import Chroma
+
+COLLECTION = "golden-sqls"
+QUERY = "revenue by month"
+EMBEDDINGS = {
+    QUERY: [1.0, 0.0],
+    "monthly sales totals": [0.9, 0.1],
+    "revenue by region": [0.5, 0.5],
+    "number of active users": [0.0, 1.0],
+}
+
+
+def embed(texts: list[str]) -> list[list[float]]:
+    return [EMBEDDINGS[text] for text in texts]
+
+
+@pytest.fixture
+def chroma(tmp_path, monkeypatch) -> Chroma:
+    store = Chroma(System(Settings()), persist_directory=str(tmp_path))
+    collection = store.chroma_client.create_collection(
+        COLLECTION, metadata=store.collection_metadata, embedding_function=embed
+    )
+    collection.add(
+        ids=["sales", "region", "users", "other-db"],
+        documents=[
+            "monthly sales totals",
+            "revenue by region",
+            "number of active users",
+            QUERY,
+        ],
+        metadatas=[
+            {"db_connection_id": "a"},
+            {"db_connection_id": "a"},
+            {"db_connection_id": "a"},
+            {"db_connection_id": "b"},
+        ],
+    )
+    monkeypatch.setattr(store.chroma_client, "get_collection", lambda _: collection)
+    return store
+
+
+def test_query_without_hybrid_keeps_dense_order(chroma):
+    results = chroma.query([QUERY], "a", COLLECTION, 2, hybrid=False)
+    assert [result["id"] for result in results] == ["sales", "region"]
+
+
+def test_hybrid_query_reranks_and_truncates_candidates(chroma):
+    results = chroma.query([QUERY], "a", COLLECTION, 2)
+    assert [result["id"] for result in results] == ["region", "sales"]
+
+
+def test_hybrid_query_with_fewer_candidates_than_requested(chroma):
+    results = chroma.query([QUERY], "a", COLLECTION, 5)
+    assert [result["id"] for result in results] == ["region", "sales", "users"]
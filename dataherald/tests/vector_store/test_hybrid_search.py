@@ -0,0 +1,34 @@
+from dataherald.utils.hybrid_search import bm25_scores, reciprocal_rank_fusion
+
+
+def test_bm25_scores_empty_corpus():
+    assert bm25_scores("total sales", []) == []
+
+
+def test_bm25_scores_no_overlap():
+    scores = bm25_scores("total sales", ["number of users", "active customers"])
+    assert scores == [0.0, 0.0]
+
+
+def test_bm25_scores_ranks_higher_term_frequency_first():
+    scores = bm25_scores(
+        "sales",
+        ["sales by region sales by month", "sales by region and month", "users"],
+    )
+    assert scores[0] > scores[1] > scores[2]
+
+
+def test_reciprocal_rank_fusion_keeps_dense_order_with_full_dense_weight():
+    dense_ids = ["a", "b", "c"]
+    sparse_scores = {"c": 3.0, "b": 2.0, "a": 1.0}
+    assert reciprocal_rank_fusion(dense_ids, sparse_scores, alpha=1) == dense_ids
+
+
+def test_reciprocal_rank_fusion_promotes_strong_sparse_match():
+    dense_ids = ["a", "b", "c"]
+    sparse_scores = {"a": 0.0, "b": 4.0, "c": 0.0}
+    assert reciprocal_rank_fusion(dense_ids, sparse_scores, alpha=0.6) == [
+        "b",
+        "a",
+        "c",
+    ]
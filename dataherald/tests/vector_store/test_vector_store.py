@@ -3,6 +3,7 @@ from typing import Any, List
 from overrides import override
 
 from dataherald.config import System
+from dataherald.types import GoldenSQL
 from dataherald.vector_store import VectorStore
 
 
@@ -17,9 +18,16 @@ class TestVectorStore(VectorStore):
         db_connection_id: str,
         collection: str,
         num_results: int,  # noqa: ARG002
+        *,
+        hybrid: bool = True,
+        alpha: float = 0.6,
     ) -> list:
         return [{"id": "64ade8ed3445882cedc06ab6", "score": 0.1}]
 
+    @override
+    def add_records(self, golden_sqls: List[GoldenSQL], collection: str):
+        pass
+
     @override
     def add_record(
         self,
@@ -35,6 +43,10 @@ class TestVectorStore(VectorStore):
     def delete_record(self, collection: str, id: str):
         pass
 
+    @override
+    def delete_records(self, collection: str, ids: List[str]):
+        pass
+
     @override
     def delete_collection(self, collection: str):  # noqa: ARG002
         pass
@@ -1,24 +1,23 @@
 import os
+import re
 from datetime import datetime
 from enum import Enum
 
-from bson.errors import InvalidId
-from bson.objectid import ObjectId
 from pydantic import BaseModel, Field, validator
 
 from dataherald.sql_database.models.types import FileStorage, SSHSettings
 from dataherald.utils.models_context_window import OPENAI_FINETUNING_MODELS_WINDOW_SIZES
 
+OBJECT_ID_PATTERN = re.compile(r"[0-9a-fA-F]{24}")
+
 
 class DBConnectionValidation(BaseModel):
     db_connection_id: str
 
     @validator("db_connection_id")
     def object_id_validation(cls, v: str):
-        try:
-            ObjectId(v)
-        except InvalidId:
-            raise ValueError("Must be a valid ObjectId")  # noqa: B904
+        if not OBJECT_ID_PATTERN.fullmatch(v):
+            raise ValueError("Must be a valid ObjectId")
         return v
 
 
@@ -29,12 +28,12 @@ class SQLQueryResult(BaseModel):
 
 class UpdateInstruction(BaseModel):
     instruction: str
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class InstructionRequest(DBConnectionValidation):
     instruction: str = Field(None, min_length=3)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class RefreshTableDescriptionRequest(DBConnectionValidation):
@@ -46,13 +45,13 @@ class Instruction(BaseModel):
     instruction: str
     db_connection_id: str
     created_at: datetime = Field(default_factory=datetime.now)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class GoldenSQLRequest(DBConnectionValidation):
     prompt_text: str = Field(None, min_length=3)
     sql: str = Field(None, min_length=3)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class GoldenSQL(BaseModel):
@@ -61,7 +60,7 @@ class GoldenSQL(BaseModel):
     sql: str
     db_connection_id: str
     created_at: datetime = Field(default_factory=datetime.now)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class SQLGenerationStatus(Enum):
@@ -79,19 +78,19 @@ class SupportedDatabase(Enum):
 
 
 class ScannerRequest(DBConnectionValidation):
-    table_names: list[str] | None
-    metadata: dict | None
+    table_names: list[str] | None = None
+    metadata: dict | None = None
 
 
 class DatabaseConnectionRequest(BaseModel):
     alias: str
     use_ssh: bool = False
     connection_uri: str
-    path_to_credentials_file: str | None
-    llm_api_key: str | None
-    ssh_settings: SSHSettings | None
-    file_storage: FileStorage | None
-    metadata: dict | None
+    path_to_credentials_file: str | None = None
+    llm_api_key: str | None = None
+    ssh_settings: SSHSettings | None = None
+    file_storage: FileStorage | None = None
+    metadata: dict | None = None
 
 
 class ForeignKeyDetail(BaseModel):
@@ -101,18 +100,18 @@ class ForeignKeyDetail(BaseModel):
 
 class ColumnDescriptionRequest(BaseModel):
     name: str
-    description: str | None
-    is_primary_key: bool | None
-    data_type: str | None
-    low_cardinality: bool | None
-    categories: list[str] | None
-    foreign_key: ForeignKeyDetail | None
+    description: str | None = None
+    is_primary_key: bool | None = None
+    data_type: str | None = None
+    low_cardinality: bool | None = None
+    categories: list[str] | None = None
+    foreign_key: ForeignKeyDetail | None = None
 
 
 class TableDescriptionRequest(BaseModel):
-    description: str | None
-    columns: list[ColumnDescriptionRequest] | None
-    metadata: dict | None
+    description: str | None = None
+    columns: list[ColumnDescriptionRequest] | None = None
+    metadata: dict | None = None
 
 
 class FineTuningStatus(Enum):
@@ -148,7 +147,7 @@ class Finetuning(BaseModel):
     model_id: str | None = None
     created_at: datetime = Field(default_factory=datetime.now)
     golden_sqls: list[str] | None = None
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class FineTuningRequest(BaseModel):
@@ -156,12 +155,12 @@ class FineTuningRequest(BaseModel):
     alias: str | None = None
     base_llm: BaseLLM | None = None
     golden_sqls: list[str] | None = None
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class CancelFineTuningRequest(BaseModel):
     finetuning_id: str
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class Prompt(BaseModel):
@@ -169,7 +168,7 @@ class Prompt(BaseModel):
     text: str
     db_connection_id: str
     created_at: datetime = Field(default_factory=datetime.now)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class LLMConfig(BaseModel):
@@ -180,24 +179,24 @@ class LLMConfig(BaseModel):
 class SQLGeneration(BaseModel):
     id: str | None = None
     prompt_id: str
-    finetuning_id: str | None
+    finetuning_id: str | None = None
     low_latency_mode: bool = False
-    llm_config: LLMConfig | None
+    llm_config: LLMConfig | None = None
     evaluate: bool = False
-    sql: str | None
+    sql: str | None = None
     status: str = "INVALID"
-    completed_at: datetime | None
-    tokens_used: int | None
-    confidence_score: float | None
-    error: str | None
+    completed_at: datetime | None = None
+    tokens_used: int | None = None
+    confidence_score: float | None = None
+    error: str | None = None
     created_at: datetime = Field(default_factory=datetime.now)
-    metadata: dict | None
+    metadata: dict | None = None
 
 
 class NLGeneration(BaseModel):
     id: str | None = None
     sql_generation_id: str
-    llm_config: LLMConfig | None
-    text: str | None
+    llm_config: LLMConfig | None = None
+    text: str | None = None
     created_at: datetime = Field(default_factory=datetime.now)
-    metadata: dict | None
+    metadata: dict | None = None
@@ -0,0 +1,66 @@
+import math
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"\w+")
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def bm25_scores(query: str, documents: list[str]) -> list[float]:
+    """Scores each document against the query with Okapi BM25, using the given documents as the corpus."""
+    tokenized_documents = [tokenize(document) for document in documents]
+    if not tokenized_documents:
+        return []
+    average_length = sum(len(tokens) for tokens in tokenized_documents) / len(
+        tokenized_documents
+    )
+    document_frequencies = Counter(
+        token for tokens in tokenized_documents for token in set(tokens)
+    )
+    query_tokens = set(tokenize(query))
+    scores = []
+    for tokens in tokenized_documents:
+        term_frequencies = Counter(tokens)
+        length_norm = 1 - BM25_B + BM25_B * len(tokens) / (average_length or 1)
+        score = 0.0
+        for token in query_tokens:
+            frequency = term_frequencies.get(token, 0)
+            if frequency == 0:
+                continue
+            document_frequency = document_frequencies[token]
+            idf = math.log(
+                1
+                + (len(tokenized_documents) - document_frequency + 0.5)
+                / (document_frequency + 0.5)
+            )
+            score += (
+                idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+            )
+        scores.append(score)
+    return scores
+
+
+def reciprocal_rank_fusion(
+    dense_ids: list[str], sparse_scores: dict[str, float], alpha: float
+) -> list[str]:
+    """Merges a dense ranking with sparse scores using weighted reciprocal rank fusion.
+
+    alpha is the weight of the dense ranking; documents with no sparse match only get the dense term.
+    """
+    fused_scores = {
+        id: alpha / (RRF_K + rank) for rank, id in enumerate(dense_ids, start=1)
+    }
+    sparse_ranking = sorted(
+        (id for id, score in sparse_scores.items() if score > 0),
+        key=sparse_scores.get,
+        reverse=True,
+    )
+    for rank, id in enumerate(sparse_ranking, start=1):
+        fused_scores[id] = fused_scores.get(id, 0.0) + (1 - alpha) / (RRF_K + rank)
+    return sorted(fused_scores, key=fused_scores.get, reverse=True)
@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+from sql_metadata import Parser
+
+
+@lru_cache(maxsize=2048)
+def validate_sql(sql: str) -> tuple:
+    return tuple(Parser(sql).tables)
+
+
+def parse_sql(sql: str) -> Exception | None:
+    """Returns the error raised while parsing the sql, or None if it is valid.
+
+    Golden SQL parse pool workers import this module, so it must only depend on sql_metadata.
+    """
+    try:
+        validate_sql(sql)
+    except Exception as e:
+        return e
+    return None
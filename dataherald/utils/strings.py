@@ -1,8 +1,10 @@
 import re
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def remove_whitespace(input_string: str) -> str:
-    return re.sub(r"\s+", " ", input_string).strip()
+    return WHITESPACE_PATTERN.sub(" ", input_string).strip()
 
 
 def contains_line_breaks(input_string: str) -> bool:
@@ -19,6 +19,9 @@ class VectorStore(Component, ABC):
         db_connection_id: str,
         collection: str,
         num_results: int,
+        *,
+        hybrid: bool = True,
+        alpha: float = 0.6,
     ) -> list:
         pass
 
@@ -45,6 +48,10 @@ class VectorStore(Component, ABC):
     def delete_record(self, collection: str, id: str):
         pass
 
+    @abstractmethod
+    def delete_records(self, collection: str, ids: List[str]):
+        pass
+
     @abstractmethod
     def delete_collection(self, collection: str):
         pass
@@ -14,6 +14,8 @@ from dataherald.types import GoldenSQL
 from dataherald.vector_store import VectorStore
 
 EMBEDDING_MODEL = "text-embedding-3-small"
+# deleteMany removes at most 20 documents per request
+DELETE_BATCH_SIZE = 20
 
 
 class Astra(VectorStore):
@@ -41,6 +43,9 @@ class Astra(VectorStore):
         db_connection_id: str,
         collection: str,
         num_results: int,
+        *,
+        hybrid: bool = True,  # noqa: ARG002
+        alpha: float = 0.6,  # noqa: ARG002
     ) -> list:
         collection = self.collection_name_formatter(collection)
         try:
@@ -143,6 +148,21 @@ class Astra(VectorStore):
         astra_collection = self.db.collection(collection)
         astra_collection.delete_one(id)
 
+    @override
+    def delete_records(self, collection: str, ids: List[str]):
+        collection = self.collection_name_formatter(collection)
+        try:
+            existing_collections = self.db.get_collections()["status"]["collections"]
+        except APIRequestError:
+            existing_collections = []
+        if collection not in existing_collections:
+            raise ValueError(f"Collection {collection} does not exist")
+        astra_collection = self.db.collection(collection)
+        for i in range(0, len(ids), DELETE_BATCH_SIZE):
+            astra_collection.delete_many(
+                filter={"_id": {"$in": ids[i : i + DELETE_BATCH_SIZE]}}
+            )
+
     @override
     def delete_collection(self, collection: str):
         collection = self.collection_name_formatter(collection)
@@ -1,13 +1,18 @@
+import os
 from typing import Any, List
 
 import chromadb
+from chromadb.api.models.Collection import Collection
 from overrides import override
 from sql_metadata import Parser
 
 from dataherald.config import System
 from dataherald.types import GoldenSQL
+from dataherald.utils.hybrid_search import bm25_scores, reciprocal_rank_fusion
 from dataherald.vector_store import VectorStore
 
+HYBRID_CANDIDATES_FACTOR = 4
+
 
 class Chroma(VectorStore):
     def __init__(
@@ -17,6 +22,15 @@ class Chroma(VectorStore):
     ):
         super().__init__(system)
         self.chroma_client = chromadb.PersistentClient(path=persist_directory)
+        # HNSW parameters are fixed when a collection is created, they do not
+        # apply to collections that already exist.
+        self.collection_metadata = {
+            "hnsw:M": int(os.environ.get("CHROMA_HNSW_M") or "32"),
+            "hnsw:construction_ef": int(
+                os.environ.get("CHROMA_HNSW_CONSTRUCTION_EF") or "256"
+            ),
+            "hnsw:search_ef": int(os.environ.get("CHROMA_HNSW_SEARCH_EF") or "10"),
+        }
 
     @override
     def query(
@@ -25,35 +39,68 @@ class Chroma(VectorStore):
         db_connection_id: str,
         collection: str,
         num_results: int,
+        *,
+        hybrid: bool = True,
+        alpha: float = 0.6,
     ) -> list:
         try:
             target_collection = self.chroma_client.get_collection(collection)
         except ValueError:
             return []
 
+        n_results = num_results * HYBRID_CANDIDATES_FACTOR if hybrid else num_results
         query_results = target_collection.query(
             query_texts=query_texts,
-            n_results=num_results,
+            n_results=n_results,
             where={"db_connection_id": db_connection_id},
         )
-        return self.convert_to_pinecone_object_model(query_results)
+        results = self.convert_to_pinecone_object_model(query_results)
+        if not hybrid:
+            return results
+        # Hybrid search only re-ranks the dense candidates: BM25 statistics are
+        # computed over those candidates, not over the whole collection.
+        candidate_ids = [result["id"] for result in results]
+        sparse_scores = dict(
+            zip(
+                candidate_ids,
+                bm25_scores(query_texts[0], query_results["documents"][0]),
+                strict=True,
+            )
+        )
+        results_by_id = {result["id"]: result for result in results}
+        fused_ids = reciprocal_rank_fusion(candidate_ids, sparse_scores, alpha)
+        return [results_by_id[id] for id in fused_ids[:num_results]]
 
     @override
     def add_records(self, golden_sqls: List[GoldenSQL], collection: str):
-        for golden_sql in golden_sqls:
-            self.add_record(
-                golden_sql.prompt_text,
-                golden_sql.db_connection_id,
-                collection,
-                [
+        target_collection = self.get_or_create_collection(collection)
+        batch_size = self.chroma_client.max_batch_size
+        for i in range(0, len(golden_sqls), batch_size):
+            batch = golden_sqls[i : i + batch_size]
+            existing_ids = set(
+                target_collection.get(ids=[str(golden_sql.id) for golden_sql in batch])[
+                    "ids"
+                ]
+            )
+            new_golden_sqls = [
+                golden_sql
+                for golden_sql in batch
+                if str(golden_sql.id) not in existing_ids
+            ]
+            if not new_golden_sqls:
+                continue
+            target_collection.add(
+                documents=[golden_sql.prompt_text for golden_sql in new_golden_sqls],
+                metadatas=[
                     {
                         "tables_used": ", ".join(Parser(golden_sql.sql))
                         if isinstance(Parser(golden_sql.sql), list)
                         else "",
                         "db_connection_id": str(golden_sql.db_connection_id),
                     }
+                    for golden_sql in new_golden_sqls
                 ],
-                ids=[str(golden_sql.id)],
+                ids=[str(golden_sql.id) for golden_sql in new_golden_sqls],
             )
 
     @override
@@ -65,23 +112,38 @@ class Chroma(VectorStore):
         metadata: Any,
         ids: List,
     ):
-        target_collection = self.chroma_client.get_or_create_collection(collection)
+        target_collection = self.get_or_create_collection(collection)
         existing_rows = target_collection.get(ids=ids)
         if len(existing_rows["documents"]) == 0:
             target_collection.add(documents=documents, metadatas=metadata, ids=ids)
 
     @override
     def delete_record(self, collection: str, id: str):
-        target_collection = self.chroma_client.get_or_create_collection(collection)
+        target_collection = self.get_or_create_collection(collection)
         target_collection.delete(ids=[id])
 
+    @override
+    def delete_records(self, collection: str, ids: List[str]):
+        target_collection = self.get_or_create_collection(collection)
+        target_collection.delete(ids=ids)
+
     @override
     def delete_collection(self, collection: str):
         return super().delete_collection(collection)
 
     @override
     def create_collection(self, collection: str):
-        return super().create_collection(collection)
+        return self.chroma_client.create_collection(
+            collection, metadata=self.collection_metadata
+        )
+
+    def get_or_create_collection(self, collection: str) -> Collection:
+        try:
+            return self.chroma_client.get_collection(collection)
+        except ValueError:
+            return self.chroma_client.get_or_create_collection(
+                collection, metadata=self.collection_metadata
+            )
 
     def convert_to_pinecone_object_model(self, chroma_results: dict) -> List:
         results = []
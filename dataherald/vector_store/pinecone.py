@@ -33,6 +33,9 @@ class Pinecone(VectorStore):
         db_connection_id: str,
         collection: str,
         num_results: int,
+        *,
+        hybrid: bool = True,  # noqa: ARG002
+        alpha: float = 0.6,  # noqa: ARG002
     ) -> list:
         index = pinecone.Index(collection)
         db_connection_repository = DatabaseConnectionRepository(
@@ -67,30 +70,38 @@ class Pinecone(VectorStore):
             openai_api_key=database_connection.decrypt_api_key(), model=EMBEDDING_MODEL
         )
         index = pinecone.Index(collection)
+        golden_sqls_with_tables = []
+        for golden_sql in golden_sqls:
+            parsed_tables = Parser(golden_sql.sql).tables
+            if len(parsed_tables) > 0:
+                golden_sqls_with_tables.append((golden_sql, parsed_tables[0]))
+        if not golden_sqls_with_tables:
+            return
         batch_limit = 100
-        for limit_index in range(0, len(golden_sqls), batch_limit):
-            golden_sql_batch = golden_sqls[limit_index : limit_index + batch_limit]
+        # OpenAIEmbeddings sends up to chunk_size inputs per request, so embed
+        # one request's worth at a time to keep only that window in memory.
+        for window_index in range(
+            0, len(golden_sqls_with_tables), embedding.chunk_size
+        ):
+            window = golden_sqls_with_tables[
+                window_index : window_index + embedding.chunk_size
+            ]
             embeds = embedding.embed_documents(
-                [record.prompt_text for record in golden_sql_batch]
+                [golden_sql.prompt_text for golden_sql, _ in window]
             )
-
-            records = []
-            for key in range(len(golden_sql_batch)):
-                parsed_tables = Parser(golden_sql_batch[key].sql).tables
-                if len(parsed_tables) > 0:
-                    records.append(
-                        (
-                            str(golden_sql_batch[key].id),
-                            embeds[key],
-                            {
-                                "tables_used": parsed_tables[0],
-                                "db_connection_id": golden_sql_batch[
-                                    key
-                                ].db_connection_id,
-                            },
-                        )
-                    )
-            index.upsert(vectors=records)
+            records = [
+                (
+                    str(golden_sql.id),
+                    embed,
+                    {
+                        "tables_used": table,
+                        "db_connection_id": golden_sql.db_connection_id,
+                    },
+                )
+                for (golden_sql, table), embed in zip(window, embeds, strict=True)
+            ]
+            for limit_index in range(0, len(records), batch_limit):
+                index.upsert(vectors=records[limit_index : limit_index + batch_limit])
 
     @override
     def add_record(
@@ -122,6 +133,15 @@ class Pinecone(VectorStore):
         index = pinecone.Index(collection)
         index.delete(ids=[id])
 
+    @override
+    def delete_records(self, collection: str, ids: List[str]):
+        if collection not in pinecone.list_indexes():
+            self.create_collection(collection)
+        index = pinecone.Index(collection)
+        batch_limit = 1000
+        for limit_index in range(0, len(ids), batch_limit):
+            index.delete(ids=ids[limit_index : limit_index + batch_limit])
+
     @override
     def delete_collection(self, collection: str):
         return pinecone.delete_index(collection)